@@ -1,14 +1,11 @@
-import uuid
-from typing import List, Dict, Optional, TYPE_CHECKING
+from array import array
+from collections import defaultdict, namedtuple
+from typing import List, Dict, Iterator, KeysView, Optional, Set, Tuple
 import time
 
-# Permite la verificación de tipos sin crear dependencia cíclica
-if TYPE_CHECKING:
-    from gestion_usuarios import Usuario, GestorUsuarios
-
-# Simulamos la importación del gestor de usuarios para validación de roles
-# En una aplicación real, esto sería inyección de dependencia.
-# from gestion_usuarios import gestor_usuarios, AccesoDenegado, UsuarioNoEncontrado, Usuario
+# Dependencia del módulo de usuarios: búsqueda de instructores/alumnos, excepciones
+# compartidas y generación de IDs
+from .gestion_usuario import obtener_usuario, AccesoDenegado, UsuarioNoEncontrado, _new_uuid_str, _new_uuid_strs
 
 # ----------------------------------------------------------------------
 # 1. EXCEPCIONES PERSONALIZADAS
@@ -30,10 +27,15 @@ class MatriculaInvalida(ErrorCurso):
 # 2. ENTIDADES PRINCIPALES (Clean Code: Representación de datos)
 # ----------------------------------------------------------------------
 
+# Módulo inmutable de un curso: título y tupla de lecciones
+Modulo = namedtuple('Modulo', ('titulo', 'lecciones'))
+
 class Certificado:
     """Representa un certificado de finalización (RF8)."""
-    def __init__(self, usuario_id: str, curso_id: str, fecha_emision: str):
-        self.id = str(uuid.uuid4())
+    __slots__ = ('id', 'usuario_id', 'curso_id', 'fecha_emision')
+
+    def __init__(self, usuario_id: str, curso_id: str, fecha_emision: str, id_certificado: Optional[str] = None):
+        self.id: str = id_certificado if id_certificado else _new_uuid_str()
         self.usuario_id = usuario_id
         self.curso_id = curso_id
         self.fecha_emision = fecha_emision
@@ -44,23 +46,40 @@ class Certificado:
 
 class Curso:
     """Representa la entidad Curso (RF1)."""
+    __slots__ = ('id', 'titulo', 'instructor_id', 'precio', 'modulos', 'publicado',
+                 '_inscritos_index', '_progreso_arr', '_total_lecciones')
+
     def __init__(self, titulo: str, instructor_id: str, precio: float = 0.0, id_curso: Optional[str] = None):
-        self.id: str = id_curso if id_curso else str(uuid.uuid4())
+        self.id: str = id_curso if id_curso else _new_uuid_str()
         self.titulo: str = titulo
         self.instructor_id: str = instructor_id
         self.precio: float = precio
-        self.modulos: List[Dict] = []
+        self.modulos: List[Modulo] = []
         self.publicado: bool = False
-        self.inscritos: List[str] = [] # Almacena IDs de usuario
-        self.progreso: Dict[str, float] = {} # {usuario_id: porcentaje_progreso}
+        # Progreso en layout SoA: posición de cada inscrito -> valor en un array contiguo
+        self._inscritos_index: Dict[str, int] = {} # {usuario_id: posición en _progreso_arr}
+        self._progreso_arr: array = array('d') # porcentaje_progreso por posición (float64)
+        self._total_lecciones: int = 0 # Contador mantenido al añadir módulos
 
     def agregar_modulo_y_lecciones(self, titulo_modulo: str, lecciones: List[str]):
         """Añade un módulo con su lista de lecciones (RF1.1)."""
-        self.modulos.append({"titulo": titulo_modulo, "lecciones": lecciones})
+        modulo = Modulo(titulo_modulo, tuple(lecciones))
+        self.modulos.append(modulo)
+        self._total_lecciones += len(modulo.lecciones)
 
     def obtener_total_lecciones(self) -> int:
-        """Función corta DRY: Calcula el número total de lecciones."""
-        return sum(len(m['lecciones']) for m in self.modulos)
+        """Función corta DRY: Devuelve el número total de lecciones en O(1)."""
+        return self._total_lecciones
+
+    @property
+    def inscritos(self) -> KeysView[str]:
+        """Vista de los IDs inscritos en orden de matrícula (pertenencia O(1))."""
+        return self._inscritos_index.keys()
+
+    def obtener_progreso(self, usuario_id: str) -> float:
+        """Devuelve el porcentaje de progreso de un inscrito (0.0 si no está inscrito)."""
+        idx = self._inscritos_index.get(usuario_id)
+        return self._progreso_arr[idx] if idx is not None else 0.0
 
     def __str__(self):
         return f"Curso(ID: {self.id}, Título: {self.titulo}, Módulos: {len(self.modulos)})"
@@ -75,27 +94,63 @@ class GestorCursos:
     def __init__(self):
         self._cursos_por_id: Dict[str, Curso] = {}
         self._certificados: Dict[str, Certificado] = {}
+        # Índices secundarios para evitar recorrer todos los cursos en cada consulta
+        # dict con valores None como conjunto ordenado: conserva el orden de creación
+        self._cursos_por_instructor: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._cursos_publicados: Set[str] = set()
+        # Catálogo materializado: se reconstruye al publicar y se sirve tal cual en lecturas
+        self._catalogo_publicado: Tuple[Curso, ...] = ()
+
+    def reset(self):
+        """Vacía el gestor en sitio (p. ej. en pruebas) sin reemplazar los diccionarios."""
+        self._cursos_por_id.clear()
+        self._certificados.clear()
+        self._cursos_por_instructor.clear()
+        self._cursos_publicados.clear()
+        self._catalogo_publicado = ()
 
     def _guardar_curso(self, curso: Curso):
-        """Función interna DRY: Persiste el objeto Curso."""
+        """Función interna DRY: Registra un Curso recién construido y actualiza los índices."""
         self._cursos_por_id[curso.id] = curso
+        self._cursos_por_instructor[curso.instructor_id][curso.id] = None
+        if curso.publicado:
+            self._indexar_publicacion(curso)
+
+    def _indexar_publicacion(self, curso: Curso):
+        """Función interna: Añade el curso al catálogo publicado (la publicación es monótona)."""
+        if curso.id in self._cursos_publicados:
+            return
+        self._cursos_publicados.add(curso.id)
+        self._catalogo_publicado += (curso,)
 
     def obtener_por_id(self, curso_id: str) -> Optional[Curso]:
         """Obtiene un curso por su ID."""
         return self._cursos_por_id.get(curso_id)
 
+    def iter_cursos_por_instructor(self, instructor_id: str) -> Iterator[Curso]:
+        """
+        Itera perezosamente los cursos creados por un instructor (RF12). Recorre una
+        copia de los IDs, por lo que el gestor puede modificarse durante la iteración.
+        """
+        ids = tuple(self._cursos_por_instructor.get(instructor_id, ()))
+        return (self._cursos_por_id[cid] for cid in ids)
+
     def obtener_cursos_por_instructor(self, instructor_id: str) -> List[Curso]:
         """Obtiene todos los cursos creados por un instructor (RF12)."""
-        return [c for c in self._cursos_por_id.values() if c.instructor_id == instructor_id]
+        return list(self.iter_cursos_por_instructor(instructor_id))
 
-    def obtener_cursos_publicados(self) -> List[Curso]:
-        """Obtiene el catálogo de cursos disponibles (RF9)."""
-        return [c for c in self._cursos_por_id.values() if c.publicado]
+    def obtener_cursos_publicados(self) -> Tuple[Curso, ...]:
+        """Obtiene el catálogo de cursos disponibles (RF9) en orden de publicación."""
+        return self._catalogo_publicado
 
     def guardar_certificado(self, certificado: Certificado):
         """Guarda un certificado en la colección."""
         self._certificados[certificado.id] = certificado
 
+    def guardar_certificados(self, certificados: List[Certificado]):
+        """Guarda un lote de certificados con una sola actualización de la colección."""
+        self._certificados.update({c.id: c for c in certificados})
+
     def obtener_certificado_por_id(self, cert_id: str) -> Optional[Certificado]:
         """Busca un certificado para su validación."""
         return self._certificados.get(cert_id)
@@ -103,15 +158,26 @@ class GestorCursos:
 # Instancia global del gestor
 gestor_cursos = GestorCursos()
 
+# Acceso directo por ID (método builtin ligado: sin frame de Python por llamada).
+# Invariante: queda ligado a este diccionario concreto, por lo que ni gestor_cursos
+# ni _cursos_por_id deben reasignarse; para vaciar el estado use gestor_cursos.reset().
+obtener_curso = gestor_cursos._cursos_por_id.get
+
+# Roles autorizados para crear cursos
+_ROLES_INSTRUCTOR = frozenset({"Maestro", "Especialista"})
+
+# Lecciones mínimas para publicar un curso (RD5)
+_MIN_LECCIONES_PUBLICACION = 3
+
 # ----------------------------------------------------------------------
 # 4. FUNCIONES DE LÓGICA DE NEGOCIO (Responsabilidad Única)
 # ----------------------------------------------------------------------
 
 def crear_curso(titulo: str, instructor_id: str, precio: float = 0.0) -> Curso:
     """Lógica de negocio: Crea una instancia de Curso (RF1)."""
-    instructor = gestor_usuarios.obtener_por_id(instructor_id)
+    instructor = obtener_usuario(instructor_id)
 
-    if not instructor or instructor.rol not in ["Maestro", "Especialista"]:
+    if not instructor or instructor.rol not in _ROLES_INSTRUCTOR:
         # Validación de rol (Clean Code: Manejo de errores de acceso)
         raise AccesoDenegado("Solo Maestros/Especialistas pueden crear cursos.")
 
@@ -121,7 +187,7 @@ def crear_curso(titulo: str, instructor_id: str, precio: float = 0.0) -> Curso:
 
 def agregar_contenido_al_curso(curso_id: str, modulo_titulo: str, lecciones: List[str]):
     """Función de responsabilidad única: Añade contenido al curso."""
-    curso = gestor_cursos.obtener_por_id(curso_id)
+    curso = obtener_curso(curso_id)
     if not curso:
         raise UsuarioNoEncontrado("Curso no encontrado.")
 
@@ -129,29 +195,29 @@ def agregar_contenido_al_curso(curso_id: str, modulo_titulo: str, lecciones: Lis
         raise ErrorCurso("No se puede editar el contenido de un curso publicado.")
 
     curso.agregar_modulo_y_lecciones(modulo_titulo, lecciones)
-    gestor_cursos._guardar_curso(curso)
 
 def publicar_curso(curso_id: str):
     """Lógica de negocio: Valida y publica un curso."""
-    curso = gestor_cursos.obtener_por_id(curso_id)
+    curso = obtener_curso(curso_id)
     if not curso:
         raise UsuarioNoEncontrado("Curso no encontrado.")
 
-    # Validación mínima de contenido (RD5)
-    if curso.obtener_total_lecciones() < 3:
-        raise PublicacionInvalida("El curso debe tener al menos 3 lecciones para ser publicado.")
+    # Validación mínima de contenido (RD5): lectura O(1) del contador de lecciones
+    if curso.obtener_total_lecciones() < _MIN_LECCIONES_PUBLICACION:
+        raise PublicacionInvalida(
+            f"El curso debe tener al menos {_MIN_LECCIONES_PUBLICACION} lecciones para ser publicado.")
 
     # Set the 'publicado' attribute to True instead of calling a non-existent method
     curso.publicado = True
-    gestor_cursos._guardar_curso(curso)
+    gestor_cursos._indexar_publicacion(curso)
     return curso
 
 def matricular_usuario(curso_id: str, usuario_id: str, pago_exitoso: bool = True):
     """
     Lógica de negocio: Matricula un usuario. Simula la verificación del pago (RF5).
     """
-    curso = gestor_cursos.obtener_por_id(curso_id)
-    usuario = gestor_usuarios.obtener_por_id(usuario_id)
+    curso = obtener_curso(curso_id)
+    usuario = obtener_usuario(usuario_id)
 
     if not curso or not usuario:
         raise UsuarioNoEncontrado("Curso o Usuario no encontrados.")
@@ -159,31 +225,60 @@ def matricular_usuario(curso_id: str, usuario_id: str, pago_exitoso: bool = True
     if not curso.publicado:
         raise MatriculaInvalida("El curso no está disponible para matrícula.")
 
-    if usuario_id in curso.inscritos:
+    # Comprueba y reserva la posición con una sola búsqueda: setdefault devuelve
+    # la posición existente si el usuario ya estaba inscrito
+    nueva_posicion = len(curso._progreso_arr)
+    if curso._inscritos_index.setdefault(usuario_id, nueva_posicion) != nueva_posicion:
         raise MatriculaInvalida("El usuario ya está inscrito.")
 
-    # Simulación de verificación de pago
+    # Simulación de verificación de pago (deshace la reserva si falla)
     if curso.precio > 0 and not pago_exitoso:
+        del curso._inscritos_index[usuario_id]
         raise Exception("Fallo de Transacción: Se requiere pago.")
 
-    curso.inscritos.append(usuario_id)
-    # Inicializa el progreso
-    curso.progreso[usuario_id] = 0.0
-    gestor_cursos._guardar_curso(curso)
+    # Inicializa el progreso en la posición reservada
+    curso._progreso_arr.append(0.0)
     return True
 
 def actualizar_progreso(curso_id: str, usuario_id: str, porcentaje: float):
     """Función de responsabilidad única: Actualiza el progreso del usuario (RF7)."""
-    curso = gestor_cursos.obtener_por_id(curso_id)
+    curso = obtener_curso(curso_id)
 
-    if not curso or usuario_id not in curso.inscritos:
+    idx = curso._inscritos_index.get(usuario_id) if curso else None
+    if idx is None:
         raise MatriculaInvalida("Usuario no matriculado o curso inexistente.")
 
-    if porcentaje >= 100 and curso.progreso.get(usuario_id, 0) < 100:
+    if porcentaje >= 100 and curso._progreso_arr[idx] < 100:
         # Lógica de emisión de certificado al 100%
         cert = Certificado(usuario_id, curso_id, str(time.time()))
         gestor_cursos.guardar_certificado(cert)
         print(f"🎉 Certificado emitido para {usuario_id}. Enlace: {cert.generar_url_verificacion()}")
 
-    curso.progreso[usuario_id] = min(porcentaje, 100.0)
-    gestor_cursos._guardar_curso(curso)
+    curso._progreso_arr[idx] = min(porcentaje, 100.0)
+
+def completar_cursos_lote(completados: List[Tuple[str, str]]) -> List[Certificado]:
+    """
+    Lógica de negocio: Marca en bloque pares (curso_id, usuario_id) como completados
+    y emite sus certificados (RF7, RF8). Valida todo el lote antes de modificar nada.
+    """
+    posiciones = []
+    for curso_id, usuario_id in completados:
+        curso = obtener_curso(curso_id)
+        idx = curso._inscritos_index.get(usuario_id) if curso else None
+        if idx is None:
+            raise MatriculaInvalida("Usuario no matriculado o curso inexistente.")
+        posiciones.append((curso, idx, usuario_id))
+
+    pendientes = []
+    for curso, idx, usuario_id in posiciones:
+        if curso._progreso_arr[idx] < 100:
+            curso._progreso_arr[idx] = 100.0
+            pendientes.append((usuario_id, curso.id))
+
+    # Un único timestamp y una única lectura de entropía para todo el lote
+    fecha_emision = str(time.time())
+    ids = _new_uuid_strs(len(pendientes))
+    certificados = [Certificado(usuario_id, curso_id, fecha_emision, cert_id)
+                    for (usuario_id, curso_id), cert_id in zip(pendientes, ids)]
+    gestor_cursos.guardar_certificados(certificados)
+    return certificados
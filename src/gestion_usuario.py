@@ -1,6 +1,10 @@
 import hashlib
+import hmac
+import os
+import sys
+import time
 import uuid
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List, Set, Tuple
 
 # ----------------------------------------------------------------------
 # 1. EXCEPCIONES PERSONALIZADAS
@@ -23,24 +27,49 @@ class AccesoDenegado(ErrorAutenticacion):
     pass
 
 # ----------------------------------------------------------------------
-# 2. ENTIDADES PRINCIPALES (Clean Code: Representación de datos)
+# 2. UTILIDADES INTERNAS
+# ----------------------------------------------------------------------
+
+def _new_uuid_str() -> str:
+    """Genera un UUID4 en formato hex (32 caracteres, sin guiones)."""
+    return uuid.uuid4().hex
+
+def _new_uuid_strs(n: int) -> List[str]:
+    """Genera n UUID4 en formato hex con una única lectura de os.urandom."""
+    entropia = os.urandom(16 * n)
+    return [uuid.UUID(bytes=entropia[i:i + 16], version=4).hex for i in range(0, 16 * n, 16)]
+
+def _hash_password(password: str) -> bytes:
+    """Devuelve el digest SHA-256 binario (32 bytes) de la contraseña en UTF-8."""
+    return hashlib.sha256(password.encode('utf-8')).digest()
+
+# Hash de relleno: iniciar_sesion siempre calcula un SHA-256, exista o no el usuario
+_DUMMY_HASH = hashlib.sha256(b'dummy-never-matches').digest()
+
+def _norm_email(email: str) -> str:
+    """Punto único de normalización de emails (minúsculas)."""
+    return email.lower()
+
+# ----------------------------------------------------------------------
+# 3. ENTIDADES PRINCIPALES (Clean Code: Representación de datos)
 # ----------------------------------------------------------------------
 
 class Usuario:
     """Clase que representa la entidad de un usuario del LMS."""
-    ROLES_VALIDOS = ["Estudiante", "Maestro", "Especialista", "Administrador"]
+    __slots__ = ('id', 'nombre', 'email', 'rol', '__password_hash', 'fecha_registro', 'activo')
+    ROLES_VALIDOS = frozenset({"Estudiante", "Maestro", "Especialista", "Administrador"})
 
     def __init__(self, nombre: str, email: str, rol: str = "Estudiante", id_usuario: Optional[str] = None):
         """Inicializa el usuario con validación de rol."""
         if rol not in self.ROLES_VALIDOS:
-            raise ValueError(f"Rol '{rol}' no válido. Debe ser uno de {self.ROLES_VALIDOS}")
+            raise ValueError(f"Rol '{rol}' no válido. Debe ser uno de: {', '.join(sorted(self.ROLES_VALIDOS))}")
             
-        self.id: str = id_usuario if id_usuario else str(uuid.uuid4())
+        self.id: str = id_usuario if id_usuario else _new_uuid_str()
         self.nombre: str = nombre
-        self.email: str = email.lower()
-        self.rol: str = rol
-        self.__password_hash: Optional[str] = None
-        self.fecha_registro: str = str(uuid.uuid1()) # Simula timestamp de registro
+        self.email: str = _norm_email(email)
+        self.rol: str = sys.intern(rol)
+        self.__password_hash: Optional[bytes] = None
+        self.fecha_registro: int = time.time_ns() # Timestamp de registro (ns desde epoch)
         self.activo: bool = True
 
     def establecer_contraseña(self, password: str):
@@ -48,23 +77,30 @@ class Usuario:
         if not password or len(password) < 8:
             raise ValueError("La contraseña debe tener al menos 8 caracteres.")
         # Usando SHA256 para simular un hash seguro (mejores prácticas)
-        self.__password_hash = hashlib.sha256(password.encode()).hexdigest()
+        self.__password_hash = _hash_password(password)
 
     def verificar_contraseña(self, password: str) -> bool:
         """Verifica si la contraseña coincide con el hash almacenado."""
-        return hashlib.sha256(password.encode()).hexdigest() == self.__password_hash
+        return self.coincide_digest(_hash_password(password))
+
+    def coincide_digest(self, digest: bytes) -> bool:
+        """Compara en tiempo constante un digest ya calculado con el hash almacenado."""
+        if self.__password_hash is None:
+            hmac.compare_digest(digest, _DUMMY_HASH)
+            return False
+        return hmac.compare_digest(digest, self.__password_hash)
 
-    def cambiar_rol(self, nuevo_rol: str):
-        """Permite cambiar el rol, usado típicamente por Administradores."""
+    def _cambiar_rol(self, nuevo_rol: str):
+        """Función interna: cambia el rol. Usar GestorUsuarios.cambiar_rol_usuario para mantener el índice."""
         if nuevo_rol not in self.ROLES_VALIDOS:
             raise ValueError(f"El nuevo rol '{nuevo_rol}' no es válido.")
-        self.rol = nuevo_rol
+        self.rol = sys.intern(nuevo_rol)
         
     def __str__(self):
         return f"Usuario(ID: {self.id}, Nombre: {self.nombre}, Rol: {self.rol})"
 
 # ----------------------------------------------------------------------
-# 3. GESTOR DE DATOS (Clean Code: Centralización de acceso a datos)
+# 4. GESTOR DE DATOS (Clean Code: Centralización de acceso a datos)
 # ----------------------------------------------------------------------
 
 class GestorUsuarios:
@@ -73,11 +109,22 @@ class GestorUsuarios:
     def __init__(self):
         # Almacena usuarios por ID (diccionario principal)
         self._usuarios_por_id: Dict[str, Usuario] = {}
-        # Mapea email a ID para búsquedas rápidas (evita duplicación de código en búsquedas)
-        self._mapeo_email_id: Dict[str, str] = {}
+        # Mapea email directamente al Usuario: una sola búsqueda por login
+        self._mapeo_email: Dict[str, Usuario] = {}
+        # Índice secundario rol -> IDs para listar usuarios por rol sin recorrerlos todos
+        # (dict con valores None como conjunto ordenado: conserva el orden de registro)
+        self._usuarios_por_rol: Dict[str, Dict[str, None]] = {r: {} for r in Usuario.ROLES_VALIDOS}
         # Pre-registro de un administrador para pruebas
         self._inicializar_admin()
 
+    def reset(self):
+        """Vacía el gestor en sitio (p. ej. en pruebas) y vuelve a registrar el administrador."""
+        self._usuarios_por_id.clear()
+        self._mapeo_email.clear()
+        for ids in self._usuarios_por_rol.values():
+            ids.clear()
+        self._inicializar_admin()
+
     def _inicializar_admin(self):
         """Inicializa un usuario administrador para las pruebas de roles."""
         admin = Usuario("System Admin", "admin@lms.com", rol="Administrador")
@@ -87,24 +134,49 @@ class GestorUsuarios:
     def _guardar_usuario(self, usuario: Usuario):
         """Función interna DRY: Guarda el objeto Usuario y actualiza el mapeo."""
         self._usuarios_por_id[usuario.id] = usuario
-        self._mapeo_email_id[usuario.email] = usuario.id
+        self._mapeo_email[usuario.email] = usuario
+        self._indexar_rol(usuario)
+
+    def _indexar_rol(self, usuario: Usuario):
+        """Función interna: Deja el ID del usuario solo en el índice de su rol actual."""
+        for rol, ids in self._usuarios_por_rol.items():
+            if rol != usuario.rol:
+                ids.pop(usuario.id, None)
+        self._usuarios_por_rol[usuario.rol][usuario.id] = None
 
     def obtener_por_id(self, user_id: str) -> Optional[Usuario]:
         """Obtiene un usuario por su ID único."""
         return self._usuarios_por_id.get(user_id)
 
     def obtener_por_email(self, email: str) -> Optional[Usuario]:
-        """Obtiene un usuario utilizando el mapeo de email a ID."""
-        user_id = self._mapeo_email_id.get(email.lower())
-        return self.obtener_por_id(user_id) if user_id else None
+        """Obtiene un usuario utilizando el mapeo de email a Usuario."""
+        return self._mapeo_email.get(_norm_email(email))
 
     def email_existe(self, email: str) -> bool:
         """Función corta DRY para verificar la existencia de un email."""
-        return email.lower() in self._mapeo_email_id
+        return _norm_email(email) in self._mapeo_email
 
     def obtener_todos_por_rol(self, rol: str) -> List[Usuario]:
         """Filtra y devuelve todos los usuarios que tienen un rol específico."""
-        return [u for u in self._usuarios_por_id.values() if u.rol == rol]
+        return list(self.iter_usuarios_por_rol(rol))
+
+    def iter_usuarios_por_rol(self, rol: str) -> Iterator[Usuario]:
+        """
+        Itera perezosamente los usuarios que tienen un rol específico. Recorre una
+        copia de los IDs, por lo que el gestor puede modificarse durante la iteración.
+        """
+        ids = tuple(self._usuarios_por_rol.get(rol, ()))
+        return (self._usuarios_por_id[uid] for uid in ids)
+
+    def cambiar_rol_usuario(self, user_id: str, nuevo_rol: str) -> Usuario:
+        """Cambia el rol de un usuario manteniendo actualizado el índice por rol."""
+        usuario = self.obtener_por_id(user_id)
+        if not usuario:
+            raise UsuarioNoEncontrado("No se puede cambiar el rol, el usuario no existe.")
+
+        usuario._cambiar_rol(nuevo_rol)
+        self._indexar_rol(usuario)
+        return usuario
     
     def actualizar_perfil(self, user_id: str, nuevos_datos: Dict[str, str]):
         """Función de responsabilidad única: Actualiza el nombre o el email del usuario (RF15)."""
@@ -116,15 +188,15 @@ class GestorUsuarios:
             usuario.nombre = nuevos_datos['nombre']
         
         # Lógica para cambiar email
-        if 'email' in nuevos_datos and nuevos_datos['email'].lower() != usuario.email:
-            nuevo_email = nuevos_datos['email'].lower()
+        nuevo_email = _norm_email(nuevos_datos['email']) if 'email' in nuevos_datos else usuario.email
+        if nuevo_email != usuario.email:
             if self.email_existe(nuevo_email):
                 raise ErrorAutenticacion("El nuevo email ya está en uso.")
             
             # Actualiza el mapeo
-            del self._mapeo_email_id[usuario.email]
+            del self._mapeo_email[usuario.email]
             usuario.email = nuevo_email
-            self._mapeo_email_id[usuario.email] = usuario.id
+            self._mapeo_email[usuario.email] = usuario
         
         self._guardar_usuario(usuario)
         return usuario
@@ -132,8 +204,13 @@ class GestorUsuarios:
 # Instancia global del gestor para simular el singleton de acceso a datos
 gestor_usuarios = GestorUsuarios() 
 
+# Acceso directo por ID (método builtin ligado: sin frame de Python por llamada).
+# Invariante: queda ligado a este diccionario concreto, por lo que ni gestor_usuarios
+# ni _usuarios_por_id deben reasignarse; para vaciar el estado use gestor_usuarios.reset().
+obtener_usuario = gestor_usuarios._usuarios_por_id.get
+
 # ----------------------------------------------------------------------
-# 4. FUNCIONES DE LÓGICA DE NEGOCIO (Responsabilidad Única)
+# 5. FUNCIONES DE LÓGICA DE NEGOCIO (Responsabilidad Única)
 # ----------------------------------------------------------------------
 
 def registrar_usuario(nombre: str, email: str, password: str, rol: str = "Estudiante") -> Usuario:
@@ -150,14 +227,46 @@ def registrar_usuario(nombre: str, email: str, password: str, rol: str = "Estudi
     gestor_usuarios._guardar_usuario(nuevo_usuario)
     return nuevo_usuario
 
+def registrar_usuarios_bulk(filas: List[Tuple[str, str, str, str]]) -> List[Usuario]:
+    """
+    Lógica de negocio: Registra en bloque filas (nombre, email, password, rol), p. ej.
+    la lista de una clase importada desde CSV (RF2). Si alguna fila es inválida no
+    se persiste ningún usuario.
+    """
+    ids = _new_uuid_strs(len(filas))
+    emails_lote: Set[str] = set()
+    nuevos: List[Usuario] = []
+    for (nombre, email, password, rol), uid in zip(filas, ids):
+        email_norm = _norm_email(email)
+        if email_norm in emails_lote or gestor_usuarios.email_existe(email_norm):
+            raise ErrorAutenticacion(f"El email '{email_norm}' ya está registrado.")
+        emails_lote.add(email_norm)
+
+        usuario = Usuario(nombre, email_norm, rol, id_usuario=uid)
+        try:
+            usuario.establecer_contraseña(password)
+        except ValueError as e:
+            raise ErrorAutenticacion(f"Error en contraseña de '{email_norm}': {e}") from e
+        nuevos.append(usuario)
+
+    for usuario in nuevos:
+        gestor_usuarios._guardar_usuario(usuario)
+    return nuevos
+
 def iniciar_sesion(email: str, password: str) -> Usuario:
     """Lógica de negocio: Autentica un usuario (RF2)."""
     usuario = gestor_usuarios.obtener_por_email(email)
 
-    if not usuario or not usuario.activo:
-        raise CredencialesInvalidas("Usuario o contraseña incorrectos.")
+    # Flujo de tiempo constante: siempre un único hash y una comparación,
+    # usando _DUMMY_HASH cuando el usuario no existe o está inactivo
+    candidato = _hash_password(password)
+    if usuario and usuario.activo:
+        valido = usuario.coincide_digest(candidato)
+    else:
+        hmac.compare_digest(candidato, _DUMMY_HASH)
+        valido = False
 
-    if not usuario.verificar_contraseña(password):
+    if not valido:
         raise CredencialesInvalidas("Usuario o contraseña incorrectos.")
     
     # Simulación de generación de token de sesión aquí si fuera necesario
@@ -1 +1,372 @@
+import unittest
+from itertools import islice
 
+from src.gestion_usuario import (
+    gestor_usuarios, obtener_usuario, registrar_usuario, UsuarioNoEncontrado,
+    registrar_usuarios_bulk, ErrorAutenticacion, iniciar_sesion, CredencialesInvalidas,
+    Usuario,
+)
+from src.gestion_cursos import (
+    gestor_cursos, obtener_curso, crear_curso, agregar_contenido_al_curso,
+    publicar_curso, matricular_usuario, actualizar_progreso, PublicacionInvalida,
+    MatriculaInvalida, completar_cursos_lote,
+)
+
+
+class BaseLMSTest(unittest.TestCase):
+    """Base común: deja los gestores globales vacíos antes de cada prueba."""
+
+    def setUp(self):
+        gestor_usuarios.reset()
+        gestor_cursos.reset()
+
+    def crear_curso_publicado(self, instructor_id: str, titulo: str = "Python"):
+        curso = crear_curso(titulo, instructor_id)
+        agregar_contenido_al_curso(curso.id, "Módulo 1", ["L1", "L2", "L3"])
+        publicar_curso(curso.id)
+        return curso
+
+
+class TestResetGestores(BaseLMSTest):
+
+    def test_reset_conserva_los_accesores_directos(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        curso = self.crear_curso_publicado(maestro.id)
+
+        gestor_usuarios.reset()
+        gestor_cursos.reset()
+
+        self.assertIsNone(obtener_usuario(maestro.id))
+        self.assertIsNone(obtener_curso(curso.id))
+        self.assertEqual(gestor_cursos.obtener_cursos_publicados(), ())
+        self.assertIsNotNone(gestor_usuarios.obtener_por_email("admin@lms.com"))
+
+        # Tras el reset, la lógica de negocio ve el estado nuevo
+        alumno = registrar_usuario("Luis", "luis@lms.com", "password1")
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        curso = self.crear_curso_publicado(maestro.id)
+        self.assertTrue(matricular_usuario(curso.id, alumno.id))
+
+
+class TestIniciarSesion(BaseLMSTest):
+
+    def test_credenciales_correctas(self):
+        alumno = registrar_usuario("Luis", "luis@lms.com", "password1")
+
+        self.assertIs(iniciar_sesion("LUIS@lms.com", "password1"), alumno)
+
+    def test_contraseña_incorrecta(self):
+        registrar_usuario("Luis", "luis@lms.com", "password1")
+
+        with self.assertRaises(CredencialesInvalidas):
+            iniciar_sesion("luis@lms.com", "password2")
+
+    def test_usuario_desconocido(self):
+        with self.assertRaises(CredencialesInvalidas):
+            iniciar_sesion("nadie@lms.com", "password1")
+
+    def test_usuario_sin_contraseña(self):
+        sin_clave = Usuario("Eva", "eva@lms.com")
+        gestor_usuarios._guardar_usuario(sin_clave)
+
+        with self.assertRaises(CredencialesInvalidas):
+            iniciar_sesion("eva@lms.com", "password1")
+
+    def test_usuario_inactivo(self):
+        alumno = registrar_usuario("Luis", "luis@lms.com", "password1")
+        alumno.activo = False
+
+        with self.assertRaises(CredencialesInvalidas):
+            iniciar_sesion("luis@lms.com", "password1")
+
+
+class TestActualizarPerfil(BaseLMSTest):
+
+    def test_cambio_de_email_actualiza_el_mapeo(self):
+        alumno = registrar_usuario("Luis", "luis@lms.com", "password1")
+
+        gestor_usuarios.actualizar_perfil(alumno.id, {"email": "Nuevo@lms.com"})
+
+        self.assertIsNone(gestor_usuarios.obtener_por_email("luis@lms.com"))
+        self.assertIs(gestor_usuarios.obtener_por_email("nuevo@lms.com"), alumno)
+        self.assertIs(gestor_usuarios.obtener_por_email("NUEVO@LMS.COM"), alumno)
+
+    def test_email_en_uso_no_modifica_los_mapeos(self):
+        luis = registrar_usuario("Luis", "luis@lms.com", "password1")
+        ana = registrar_usuario("Ana", "ana@lms.com", "password1")
+
+        with self.assertRaises(ErrorAutenticacion):
+            gestor_usuarios.actualizar_perfil(luis.id, {"email": "ANA@lms.com"})
+
+        self.assertEqual(luis.email, "luis@lms.com")
+        self.assertIs(gestor_usuarios.obtener_por_email("luis@lms.com"), luis)
+        self.assertIs(gestor_usuarios.obtener_por_email("ana@lms.com"), ana)
+
+
+class TestRegistrarUsuariosBulk(BaseLMSTest):
+
+    def test_registra_todas_las_filas(self):
+        filas = [(f"a{i}", f"A{i}@lms.com", "password1", "Estudiante") for i in range(5)]
+
+        usuarios = registrar_usuarios_bulk(filas)
+
+        self.assertEqual(len(usuarios), 5)
+        self.assertEqual(len({u.id for u in usuarios}), 5)
+        self.assertIs(gestor_usuarios.obtener_por_email("a3@lms.com"), usuarios[3])
+        self.assertTrue(usuarios[3].verificar_contraseña("password1"))
+
+    def test_email_duplicado_en_el_lote_no_persiste_nada(self):
+        filas = [
+            ("Ana", "ana@lms.com", "password1", "Estudiante"),
+            ("Otra Ana", "ANA@lms.com", "password1", "Estudiante"),
+        ]
+
+        with self.assertRaises(ErrorAutenticacion):
+            registrar_usuarios_bulk(filas)
+
+        self.assertFalse(gestor_usuarios.email_existe("ana@lms.com"))
+        self.assertEqual(gestor_usuarios.obtener_todos_por_rol("Estudiante"), [])
+
+    def test_email_ya_registrado_no_persiste_nada(self):
+        registrar_usuario("Ana", "ana@lms.com", "password1")
+        filas = [
+            ("Luis", "luis@lms.com", "password1", "Estudiante"),
+            ("Ana", "ana@lms.com", "password1", "Estudiante"),
+        ]
+
+        with self.assertRaises(ErrorAutenticacion):
+            registrar_usuarios_bulk(filas)
+
+        self.assertFalse(gestor_usuarios.email_existe("luis@lms.com"))
+
+    def test_contraseña_corta_no_persiste_nada(self):
+        filas = [
+            ("Luis", "luis@lms.com", "password1", "Estudiante"),
+            ("Ana", "ana@lms.com", "corta", "Estudiante"),
+        ]
+
+        with self.assertRaises(ErrorAutenticacion):
+            registrar_usuarios_bulk(filas)
+
+        self.assertFalse(gestor_usuarios.email_existe("luis@lms.com"))
+
+
+class TestIndicePorRol(BaseLMSTest):
+
+    def test_cambiar_rol_usuario_mueve_el_id_entre_roles(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+
+        gestor_usuarios.cambiar_rol_usuario(maestro.id, "Administrador")
+
+        self.assertEqual(gestor_usuarios.obtener_todos_por_rol("Maestro"), [])
+        self.assertIn(maestro, gestor_usuarios.obtener_todos_por_rol("Administrador"))
+
+    def test_actualizar_perfil_tras_cambio_de_rol_no_duplica(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        gestor_usuarios.cambiar_rol_usuario(maestro.id, "Especialista")
+
+        gestor_usuarios.actualizar_perfil(maestro.id, {"nombre": "Ana María"})
+
+        self.assertEqual(gestor_usuarios.obtener_todos_por_rol("Maestro"), [])
+        self.assertEqual(gestor_usuarios.obtener_todos_por_rol("Especialista"), [maestro])
+
+    def test_rol_invalido_no_modifica_el_indice(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+
+        with self.assertRaises(ValueError):
+            gestor_usuarios.cambiar_rol_usuario(maestro.id, "Invitado")
+
+        self.assertEqual(maestro.rol, "Maestro")
+        self.assertEqual(gestor_usuarios.obtener_todos_por_rol("Maestro"), [maestro])
+
+    def test_mensaje_de_rol_invalido_es_determinista(self):
+        with self.assertRaisesRegex(
+                ValueError, "Debe ser uno de: Administrador, Especialista, Estudiante, Maestro"):
+            registrar_usuario("Ana", "ana@lms.com", "password1", "Invitado")
+
+    def test_usuario_inexistente(self):
+        with self.assertRaises(UsuarioNoEncontrado):
+            gestor_usuarios.cambiar_rol_usuario("no-existe", "Maestro")
+
+    def test_orden_de_registro(self):
+        nombres = [f"alumno{i}" for i in range(10)]
+        for nombre in nombres:
+            registrar_usuario(nombre, f"{nombre}@lms.com", "password1")
+
+        listado = gestor_usuarios.obtener_todos_por_rol("Estudiante")
+        self.assertEqual([u.nombre for u in listado], nombres)
+
+
+class TestCatalogoPublicado(BaseLMSTest):
+
+    def setUp(self):
+        super().setUp()
+        self.maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+
+    def test_curso_publicado_aparece_y_borrador_no(self):
+        publicado = self.crear_curso_publicado(self.maestro.id)
+        borrador = crear_curso("Borrador", self.maestro.id)
+
+        catalogo = gestor_cursos.obtener_cursos_publicados()
+
+        self.assertIn(publicado, catalogo)
+        self.assertNotIn(borrador, catalogo)
+
+    def test_publicar_dos_veces_no_duplica(self):
+        curso = self.crear_curso_publicado(self.maestro.id)
+
+        publicar_curso(curso.id)
+
+        self.assertEqual(gestor_cursos.obtener_cursos_publicados(), (curso,))
+
+    def test_orden_de_publicacion(self):
+        primero = crear_curso("Primero", self.maestro.id)
+        segundo = crear_curso("Segundo", self.maestro.id)
+        for curso in (primero, segundo):
+            agregar_contenido_al_curso(curso.id, "Módulo 1", ["L1", "L2", "L3"])
+
+        publicar_curso(segundo.id)
+        publicar_curso(primero.id)
+
+        self.assertEqual(gestor_cursos.obtener_cursos_publicados(), (segundo, primero))
+
+
+class TestMatricula(BaseLMSTest):
+
+    def test_usuario_ya_inscrito_tiene_prioridad_sobre_fallo_de_pago(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        alumno = registrar_usuario("Luis", "luis@lms.com", "password1")
+        curso = self.crear_curso_publicado(maestro.id)
+        curso.precio = 10.0
+        matricular_usuario(curso.id, alumno.id)
+
+        with self.assertRaisesRegex(MatriculaInvalida, "ya está inscrito"):
+            matricular_usuario(curso.id, alumno.id, pago_exitoso=False)
+
+    def test_fallo_de_pago_no_matricula(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        alumno = registrar_usuario("Luis", "luis@lms.com", "password1")
+        curso = self.crear_curso_publicado(maestro.id)
+        curso.precio = 10.0
+
+        with self.assertRaisesRegex(Exception, "Fallo de Transacción"):
+            matricular_usuario(curso.id, alumno.id, pago_exitoso=False)
+        self.assertNotIn(alumno.id, curso.inscritos)
+
+
+class TestProgreso(BaseLMSTest):
+
+    def test_progreso_se_conserva_sin_perdida_de_precision(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        alumno = registrar_usuario("Luis", "luis@lms.com", "password1")
+        curso = self.crear_curso_publicado(maestro.id)
+        matricular_usuario(curso.id, alumno.id)
+
+        actualizar_progreso(curso.id, alumno.id, 33.3)
+
+        self.assertEqual(curso.obtener_progreso(alumno.id), 33.3)
+
+
+class TestContenidoCurso(BaseLMSTest):
+
+    def test_agregar_modulo_acepta_iterables_sin_longitud(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        curso = crear_curso("Python", maestro.id)
+
+        agregar_contenido_al_curso(curso.id, "Módulo 1", (f"L{i}" for i in range(3)))
+
+        self.assertEqual(curso.modulos[0].lecciones, ("L0", "L1", "L2"))
+        self.assertEqual(curso.obtener_total_lecciones(), 3)
+
+    def test_publicar_sin_lecciones_suficientes(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        curso = crear_curso("Python", maestro.id)
+        agregar_contenido_al_curso(curso.id, "Módulo 1", ["L1", "L2"])
+
+        with self.assertRaisesRegex(PublicacionInvalida, "al menos 3 lecciones"):
+            publicar_curso(curso.id)
+        self.assertFalse(curso.publicado)
+
+
+class TestCompletarCursosLote(BaseLMSTest):
+
+    def setUp(self):
+        super().setUp()
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        self.curso = self.crear_curso_publicado(maestro.id)
+        self.alumnos = [registrar_usuario(f"a{i}", f"a{i}@lms.com", "password1") for i in range(3)]
+        for alumno in self.alumnos:
+            matricular_usuario(self.curso.id, alumno.id)
+
+    def test_emite_un_certificado_por_alumno(self):
+        certificados = completar_cursos_lote([(self.curso.id, a.id) for a in self.alumnos])
+
+        self.assertEqual(len(certificados), 3)
+        self.assertEqual(len({c.id for c in certificados}), 3)
+        self.assertEqual(len({c.fecha_emision for c in certificados}), 1)
+        for cert in certificados:
+            self.assertIs(gestor_cursos.obtener_certificado_por_id(cert.id), cert)
+        for alumno in self.alumnos:
+            self.assertEqual(self.curso.obtener_progreso(alumno.id), 100.0)
+
+    def test_par_duplicado_emite_un_solo_certificado(self):
+        alumno = self.alumnos[0]
+        certificados = completar_cursos_lote([(self.curso.id, alumno.id), (self.curso.id, alumno.id)])
+
+        self.assertEqual(len(certificados), 1)
+        self.assertEqual(len(gestor_cursos._certificados), 1)
+
+    def test_no_emite_para_cursos_ya_completados(self):
+        completar_cursos_lote([(self.curso.id, self.alumnos[0].id)])
+
+        certificados = completar_cursos_lote([(self.curso.id, a.id) for a in self.alumnos])
+
+        self.assertEqual(len(certificados), 2)
+
+    def test_lote_invalido_no_modifica_nada(self):
+        lote = [(self.curso.id, self.alumnos[0].id), (self.curso.id, "no-inscrito")]
+
+        with self.assertRaises(MatriculaInvalida):
+            completar_cursos_lote(lote)
+
+        self.assertEqual(self.curso.obtener_progreso(self.alumnos[0].id), 0.0)
+        self.assertEqual(len(gestor_cursos._certificados), 0)
+
+
+class TestIteradores(BaseLMSTest):
+
+    def test_iter_cursos_por_instructor(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        otro = registrar_usuario("Eva", "eva@lms.com", "password1", "Maestro")
+        cursos = [crear_curso(f"Curso {i}", maestro.id) for i in range(5)]
+        crear_curso("Ajeno", otro.id)
+
+        self.assertEqual(list(islice(gestor_cursos.iter_cursos_por_instructor(maestro.id), 2)), cursos[:2])
+        self.assertEqual(gestor_cursos.obtener_cursos_por_instructor(maestro.id), cursos)
+        self.assertEqual(list(gestor_cursos.iter_cursos_por_instructor("sin-cursos")), [])
+
+    def test_iter_usuarios_por_rol(self):
+        alumnos = [registrar_usuario(f"a{i}", f"a{i}@lms.com", "password1") for i in range(5)]
+        registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+
+        self.assertEqual(list(islice(gestor_usuarios.iter_usuarios_por_rol("Estudiante"), 3)), alumnos[:3])
+        self.assertEqual(gestor_usuarios.obtener_todos_por_rol("Estudiante"), alumnos)
+        self.assertEqual(list(gestor_usuarios.iter_usuarios_por_rol("Invitado")), [])
+
+    def test_iteradores_toleran_altas_durante_la_iteracion(self):
+        maestro = registrar_usuario("Ana", "ana@lms.com", "password1", "Maestro")
+        cursos = [crear_curso(f"Curso {i}", maestro.id) for i in range(2)]
+        alumnos = [registrar_usuario(f"a{i}", f"a{i}@lms.com", "password1") for i in range(2)]
+
+        it_cursos = gestor_cursos.iter_cursos_por_instructor(maestro.id)
+        it_alumnos = gestor_usuarios.iter_usuarios_por_rol("Estudiante")
+        primeros = (next(it_cursos), next(it_alumnos))
+        crear_curso("Nuevo", maestro.id)
+        registrar_usuario("Nuevo", "nuevo@lms.com", "password1")
+
+        self.assertEqual([primeros[0]] + list(it_cursos), cursos)
+        self.assertEqual([primeros[1]] + list(it_alumnos), alumnos)
+
+
+if __name__ == '__main__':
+    unittest.main()